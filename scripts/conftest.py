@@ -0,0 +1,9 @@
+"""
+pytest setup: the scripts import each other as top-level modules
+(as when run with `python scripts/<name>.py`), so put this folder on sys.path.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Adaptive Refresh Scheduler
+Tracks how often each listing URL actually changes and plans which ones are due.
+Run before the scrapers; they only fetch URLs in the plan, within a global request budget.
+
+Usage:
+    python scripts/refresh_schedule.py            # plan the next run
+    python scripts/refresh_schedule.py --full     # force a full refresh
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# ── Config ──────────────────────────────────────────────────────────────────
+STATE_FILE = Path(__file__).parent / "refresh_state.json"
+
+# Max listing fetches per run, across all sources. Keep it below the total
+# number of listing URLs in the scrapers' configs, or it never caps a run.
+REQUEST_BUDGET = 6
+DEFAULT_INTERVAL_HOURS = 24    # Until a URL has history, refresh it daily
+MIN_INTERVAL_HOURS = 6         # Matches the workflow cron; no point going lower
+MAX_INTERVAL_HOURS = 24 * 7    # Even static listings get re-checked weekly
+DUE_SLACK_HOURS = 1            # Absorbs cron start jitter
+PLAN_TTL_HOURS = MIN_INTERVAL_HOURS  # A plan only applies to the run that made it
+HISTORY_SIZE = 20              # Observations kept per URL
+
+# Fields that drift on almost every scrape (timestamps, counters) and say nothing
+# about which items are listed or what they contain
+VOLATILE_FIELDS = ("scrapedAt", "sales", "rating", "ratingCount")
+
+
+def load_state() -> dict:
+    """Load the scheduler state, or an empty one."""
+    if STATE_FILE.exists():
+        try:
+            return json.loads(STATE_FILE.read_text())
+        except (json.JSONDecodeError, KeyError):
+            pass
+    return {"plan": None, "urls": {}}
+
+
+def save_state(state: dict):
+    """Save the scheduler state."""
+    STATE_FILE.write_text(json.dumps(state, indent=2, ensure_ascii=False))
+
+
+def content_hash(items: List[dict]) -> str:
+    """Hash parsed listing results, ignoring VOLATILE_FIELDS."""
+    stable = sorted(
+        ({k: v for k, v in item.items() if k not in VOLATILE_FIELDS} for item in items),
+        key=lambda item: str(item.get("id", "")),
+    )
+    payload = json.dumps(stable, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def hours_between(start: str, end: datetime) -> float:
+    """Hours from an ISO timestamp to `end`."""
+    return (end - datetime.fromisoformat(start)).total_seconds() / 3600
+
+
+def refresh_interval(entry: Optional[dict]) -> float:
+    """Hours to wait between fetches of a URL, from its change history.
+
+    Uses the Cho & Garcia-Molina estimator for a Poisson change rate observed
+    at irregular checks: rate = -ln((n - X + 0.5) / (n + 0.5)) / mean_gap,
+    where X of the last n checks saw a change. The interval is 1 / rate,
+    capped at twice the observed gap so quiet URLs back off gradually.
+    """
+    history = (entry or {}).get("history", [])
+    if not history:
+        return DEFAULT_INTERVAL_HOURS
+
+    n = len(history)
+    changes = sum(1 for h in history if h["changed"])
+    mean_gap = max(sum(h["hours"] for h in history) / n, MIN_INTERVAL_HOURS)
+    rate = -math.log((n - changes + 0.5) / (n + 0.5)) / mean_gap
+
+    interval = 1 / rate if rate > 0 else MAX_INTERVAL_HOURS
+    return max(MIN_INTERVAL_HOURS, min(interval, 2 * mean_gap, MAX_INTERVAL_HOURS))
+
+
+def retry_delay(entry: dict) -> float:
+    """Hours to wait before retrying a URL whose last fetches failed.
+
+    Starts at MIN_INTERVAL_HOURS and doubles with each consecutive failure.
+    """
+    return min(MIN_INTERVAL_HOURS * 2 ** (entry["failures"] - 1), MAX_INTERVAL_HOURS)
+
+
+def plan_run(state: dict, urls: Dict[str, List[str]], budget: int = REQUEST_BUDGET,
+             force: bool = False, now: Optional[datetime] = None) -> List[str]:
+    """Pick the URLs to fetch this run and store the plan in `state`.
+
+    `urls` maps each source to its listing URLs. Due URLs are ranked by how
+    overdue they are (never-attempted first) and cut to `budget`; URLs whose
+    last fetch failed are due again after retry_delay(). `force` plans every
+    URL regardless of schedule or budget.
+    """
+    now = now or datetime.now(timezone.utc)
+    all_urls = [url for source_urls in urls.values() for url in source_urls]
+
+    # Forget URLs that are no longer configured
+    state["urls"] = {url: entry for url, entry in state.get("urls", {}).items()
+                     if url in all_urls}
+
+    if force:
+        planned = all_urls
+    else:
+        ranked = []
+        for url in all_urls:
+            entry = state["urls"].get(url)
+            if not entry:
+                ranked.append((math.inf, url))
+                continue
+            if entry.get("failures"):
+                elapsed = hours_between(entry["lastAttempted"], now)
+                interval = retry_delay(entry)
+            else:
+                elapsed = hours_between(entry["lastFetched"], now)
+                interval = refresh_interval(entry)
+            if elapsed + DUE_SLACK_HOURS >= interval:
+                ranked.append((elapsed / interval, url))
+        ranked.sort(key=lambda r: r[0], reverse=True)
+        planned = [url for _, url in ranked[:budget]]
+
+    state["plan"] = {"createdAt": now.isoformat(), "urls": planned}
+    return planned
+
+
+def should_fetch(state: dict, url: str, now: Optional[datetime] = None) -> bool:
+    """True if `url` is in the current plan.
+
+    With no plan, or one older than a cron period (e.g. a local run long after
+    the last CI plan), everything is fetched.
+    """
+    now = now or datetime.now(timezone.utc)
+    plan = state.get("plan")
+    if plan is None or hours_between(plan["createdAt"], now) > PLAN_TTL_HOURS:
+        return True
+    return url in plan["urls"]
+
+
+def record_fetch(state: dict, url: str, items: List[dict],
+                 now: Optional[datetime] = None) -> bool:
+    """Record a successful fetch of `url`. Returns True if its content changed."""
+    now = now or datetime.now(timezone.utc)
+    digest = content_hash(items)
+    entry = state.setdefault("urls", {}).get(url)
+
+    changed = True
+    if entry and "lastFetched" in entry:
+        changed = digest != entry["hash"]
+        entry["history"] = (entry.get("history", []) + [{
+            "hours": round(hours_between(entry["lastFetched"], now), 2),
+            "changed": changed,
+        }])[-HISTORY_SIZE:]
+    else:
+        entry = state["urls"][url] = {"history": []}
+
+    entry.pop("failures", None)
+    entry.pop("lastAttempted", None)
+    entry["hash"] = digest
+    entry["lastFetched"] = now.isoformat()
+    if changed:
+        entry["lastChanged"] = now.isoformat()
+    entry["ids"] = sorted({str(item.get("id", "")) for item in items})
+    entry["intervalHours"] = round(refresh_interval(entry), 1)
+    return changed
+
+
+def record_failure(state: dict, url: str, now: Optional[datetime] = None):
+    """Record a failed fetch of `url`, backing off its next attempt."""
+    now = now or datetime.now(timezone.utc)
+    entry = state.setdefault("urls", {}).setdefault(url, {"history": []})
+    entry["failures"] = entry.get("failures", 0) + 1
+    entry["lastAttempted"] = now.isoformat()
+
+
+def retained_items(state: dict, skipped_urls: List[str], existing: List[dict],
+                   fresh_ids: set) -> List[dict]:
+    """Existing items to keep because their listing was not fetched this run.
+
+    Items are kept if they belong to a skipped URL's last known results. If a
+    skipped URL has never been fetched successfully, all existing items are kept.
+    """
+    entries = [state.get("urls", {}).get(url) for url in skipped_urls]
+    if any(entry is None or "ids" not in entry for entry in entries):
+        keep = None
+    else:
+        keep = {item_id for entry in entries for item_id in entry["ids"]}
+
+    return [t for t in existing
+            if t.get("id") not in fresh_ids and (keep is None or t.get("id") in keep)]
+
+
+def configured_urls() -> Dict[str, List[str]]:
+    """Collect listing URLs from every scraper's config.
+
+    Sources that cannot run (Envato without an API token) are left out, so
+    they never take a slot in the budget.
+    """
+    import scrape_envato
+    import scrape_framer
+    import scrape_webflow
+
+    urls = {
+        scrape_webflow.PLATFORM: [p["url"] for p in scrape_webflow.PAGES_TO_SCRAPE],
+        scrape_framer.PLATFORM: [p["url"] for p in scrape_framer.PAGES_TO_SCRAPE],
+    }
+    if scrape_envato.get_token():
+        urls[scrape_envato.PLATFORM] = [scrape_envato.listing_url(c)
+                                        for c in scrape_envato.CATEGORIES]
+    else:
+        print("  ⚠ No ENVATO_API_TOKEN found. Leaving Envato out of the plan.")
+    return urls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plan which listing URLs to refresh.")
+    parser.add_argument("--full", action="store_true",
+                        help="Refresh every URL, ignoring schedule and budget")
+    parser.add_argument("--budget", type=int,
+                        default=int(os.environ.get("REFRESH_BUDGET") or REQUEST_BUDGET),
+                        help=f"Max listing fetches this run (default {REQUEST_BUDGET})")
+    args = parser.parse_args()
+    force = args.full or os.environ.get("FULL_REFRESH", "").lower() in ("1", "true", "yes")
+
+    print("🗓  Refresh Scheduler — planning the next scrape...")
+
+    state = load_state()
+    urls = configured_urls()
+    planned = plan_run(state, urls, budget=args.budget, force=force)
+    save_state(state)
+
+    for source, source_urls in urls.items():
+        due = [u for u in source_urls if u in planned]
+        print(f"  📦 {source}: {len(due)}/{len(source_urls)} URLs planned")
+        for url in source_urls:
+            entry = state["urls"].get(url)
+            mark = "→" if url in planned else "·"
+            if entry and entry.get("failures"):
+                note = f"failed {entry['failures']}x, retry after {retry_delay(entry):.0f}h"
+            else:
+                note = f"every {refresh_interval(entry):.0f}h"
+            print(f"     {mark} {url} ({note})")
+
+    total = sum(len(u) for u in urls.values())
+    mode = "full refresh" if force else f"budget {args.budget}"
+    print(f"✅ Planned {len(planned)}/{total} URLs ({mode})")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,13 +11,17 @@ import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+from urllib.parse import urlencode
 
 import re
 
 import requests
 from bs4 import BeautifulSoup
 
+from refresh_schedule import (load_state, record_failure, record_fetch, retained_items, save_state,
+                              should_fetch)
+
 # ── Config ──────────────────────────────────────────────────────────────────
 API_BASE = "https://api.envato.com/v1/discovery/search/search/item"
 OUTPUT_FILE = Path(__file__).parent.parent / "public" / "data" / "templates.json"
@@ -51,9 +55,16 @@ def get_token() -> str:
     return ""
 
 
+def listing_url(cat_config: dict) -> str:
+    """Stable URL identifying a search in CATEGORIES, used by the refresh scheduler."""
+    params = {k: cat_config[k] for k in ("term", "category", "tags") if cat_config.get(k)}
+    return f"{API_BASE}?{urlencode(params)}"
+
+
 def fetch_items(token: str, term: str = "", category: str = "wordpress",
-                tags: str = "", sort_by: str = "sales", page_size: int = 30) -> List[dict]:
-    """Search ThemeForest via Envato API."""
+                tags: str = "", sort_by: str = "sales",
+                page_size: int = 30) -> Optional[List[dict]]:
+    """Search ThemeForest via Envato API. Returns None if the request fails."""
     headers = {"Authorization": f"Bearer {token}"}
     params = {
         "site": "themeforest.net",
@@ -75,7 +86,7 @@ def fetch_items(token: str, term: str = "", category: str = "wordpress",
         return data.get("matches", [])
     except requests.RequestException as e:
         print(f"  ⚠ API error for term='{term}' category='{category}': {e}", file=sys.stderr)
-        return []
+        return None
 
 
 def clean_html(html: str, max_length: int = 800) -> str:
@@ -210,34 +221,55 @@ def main():
     print(f"🔍 Envato Scraper — fetching from ThemeForest API...")
 
     all_items: Dict[str, dict] = {}  # Deduplicate by ID
+    state = load_state()
+    skipped_urls: List[str] = []
 
     for cat_config in CATEGORIES:
         term = cat_config.get("term", "")
         category = cat_config.get("category", "")
         tags = cat_config.get("tags", "")
         label = term or category or "all"
+        url = listing_url(cat_config)
+
+        if not should_fetch(state, url):
+            print(f"  ⏭ Skipping: {label} (not due)")
+            skipped_urls.append(url)
+            continue
+
         print(f"  📦 Searching: {label}...")
 
         items = fetch_items(token, term=term, category=category, tags=tags)
+        if items is None:
+            record_failure(state, url)
+            skipped_urls.append(url)
+            continue
         print(f"     Found {len(items)} items")
 
-        for item in items:
-            transformed = transform_item(item)
+        transformed_items = [transform_item(item) for item in items]
+        if not record_fetch(state, url, transformed_items):
+            print("     Unchanged since last fetch")
+
+        for transformed in transformed_items:
             all_items[transformed["id"]] = transformed
 
         time.sleep(0.5)  # Be nice to the API
 
-    # Load existing data and merge
+    # Load existing data and merge, keeping items from searches not fetched this run
     existing = load_existing()
     non_envato = [t for t in existing.get("templates", [])
                   if not t.get("id", "").startswith("envato-")]
+    old_envato = [t for t in existing.get("templates", [])
+                  if t.get("id", "").startswith("envato-")]
 
     envato_templates = list(all_items.values())
+    if skipped_urls:
+        envato_templates += retained_items(state, skipped_urls, old_envato, set(all_items))
     # Sort by sales descending
     envato_templates.sort(key=lambda x: x.get("sales", 0), reverse=True)
 
     existing["templates"] = non_envato + envato_templates
     save_templates(existing)
+    save_state(state)
 
     print(f"✅ Saved {len(envato_templates)} Envato templates ({len(existing['templates'])} total)")
 
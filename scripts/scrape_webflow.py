@@ -11,11 +11,14 @@ import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import requests
 from bs4 import BeautifulSoup
 
+from refresh_schedule import (load_state, record_failure, record_fetch, retained_items, save_state,
+                              should_fetch)
+
 # ── Config ──────────────────────────────────────────────────────────────────
 OUTPUT_FILE = Path(__file__).parent.parent / "public" / "data" / "templates.json"
 PLATFORM = "Webflow"
@@ -176,33 +179,50 @@ def main():
     print("🔍 Webflow Scraper — fetching templates from webflow.com...")
 
     all_templates: Dict[str, dict] = {}  # Deduplicate by ID
+    state = load_state()
+    skipped_urls: List[str] = []
 
     for page_config in PAGES_TO_SCRAPE:
         url = page_config["url"]
         label = page_config["label"]
+
+        if not should_fetch(state, url):
+            print(f"  ⏭ Skipping: {label} (not due)")
+            skipped_urls.append(url)
+            continue
+
         print(f"  📦 Scraping: {label} ({url})...")
 
         html = fetch_page(url)
         if not html:
+            record_failure(state, url)
+            skipped_urls.append(url)
             continue
 
         templates = parse_templates(html, category=label)
         print(f"     Found {len(templates)} templates")
+        if not record_fetch(state, url, templates):
+            print("     Unchanged since last fetch")
 
         for tpl in templates:
             all_templates[tpl["id"]] = tpl
 
         time.sleep(1)  # Be respectful
 
-    # Load existing data and merge
+    # Load existing data and merge, keeping items from pages not fetched this run
     existing = load_existing()
     non_webflow = [t for t in existing.get("templates", [])
                    if not t.get("id", "").startswith("webflow-")]
+    old_webflow = [t for t in existing.get("templates", [])
+                   if t.get("id", "").startswith("webflow-")]
 
     webflow_templates = list(all_templates.values())
+    if skipped_urls:
+        webflow_templates += retained_items(state, skipped_urls, old_webflow, set(all_templates))
 
     existing["templates"] = non_webflow + webflow_templates
     save_templates(existing)
+    save_state(state)
 
     print(f"✅ Saved {len(webflow_templates)} Webflow templates ({len(existing['templates'])} total)")
 
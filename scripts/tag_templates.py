@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Template Auto-Tagger
+Assigns normalized tags and categories from a shared taxonomy to every template.
+Runs after the scrapers, in one vectorized TF-IDF pass over public/data/templates.json.
+"""
+
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+# ── Config ──────────────────────────────────────────────────────────────────
+OUTPUT_FILE = Path(__file__).parent.parent / "public" / "data" / "templates.json"
+
+# Canonical tag → keywords (lowercase, one or two words) that signal it.
+# Plurals ending in "s" match automatically; list other inflections explicitly.
+# Order matters only for ties: earlier entries win.
+TAXONOMY: Dict[str, List[str]] = {
+    "Portfolio": ["portfolio", "personal", "resume", "cv", "showcase", "freelancer", "freelance",
+                  "designer"],
+    "Agency": ["agency", "agencies", "studio", "digital agency", "creative agency",
+               "marketing agency"],
+    "SaaS": ["saas", "software", "app", "dashboard", "product", "ai", "analytics"],
+    "Startup": ["startup", "launch", "waitlist", "founder", "mvp"],
+    "Business": ["business", "businesses", "corporate", "company", "companies", "consulting",
+                 "consultant", "consultancy", "firm", "finance", "financial", "fintech", "bank",
+                 "banking", "wallet", "investment", "accounting", "lawyer", "legal", "insurance"],
+    "Ecommerce": ["ecommerce", "e commerce", "shop", "shopping", "store", "woocommerce", "shopify",
+                  "product catalog", "retail"],
+    "Blog": ["blog", "blogging", "magazine", "news", "journal", "editorial", "newsletter",
+             "podcast", "publishing", "writer"],
+    "Landing Page": ["landing", "landing page", "one page", "onepage", "single page",
+                     "coming soon"],
+    "Technology": ["technology", "technologies", "tech", "it solutions", "cyber", "security",
+                   "web3", "crypto", "blockchain", "developer", "hosting"],
+    "Creative": ["creative", "art", "artist", "design", "minimal", "modern", "bold"],
+    "Photography": ["photography", "photographer", "photo", "gallery", "galleries", "videography",
+                    "videographer", "film", "filmmaker"],
+    "Education": ["education", "educational", "elearning", "learning", "course", "school",
+                  "academy", "academies", "university", "lms", "tutor", "teacher", "training",
+                  "kindergarten"],
+    "Health": ["health", "healthcare", "medical", "clinic", "hospital", "doctor", "dental",
+               "dentist", "therapy", "fitness", "gym", "yoga", "wellness", "spa", "salon",
+               "beauty"],
+    "Restaurant": ["restaurant", "food", "cafe", "coffee", "bakery", "bakeries", "bistro", "pub",
+                   "recipe", "menu", "catering"],
+    "Real Estate": ["real estate", "property", "properties", "realtor", "realty", "apartment",
+                    "rental", "architecture", "architect", "interior"],
+    "Events": ["event", "conference", "wedding", "meetup", "festival"],
+    "Nonprofit": ["nonprofit", "non profit", "charity", "charities", "donation", "ngo", "church",
+                  "foundation", "volunteer", "fundraising"],
+    "Travel": ["travel", "tour", "hotel", "booking", "resort", "tourism", "vacation", "flight"],
+    "Construction": ["construction", "builders", "contractor", "renovation", "plumber",
+                     "plumbing", "roofing", "electrician", "handyman", "gardener", "landscaping",
+                     "cleaning", "repair", "industrial", "factory"],
+}
+
+FALLBACK_CATEGORY = "General"
+MAX_TAGS = 4               # Taxonomy tags per template (platform tag is extra)
+MIN_SCORE = 0.15           # Cosine score a tag needs to be assigned
+TITLE_WEIGHT = 2           # Title term frequency counts this many times vs. other fields
+DESCRIPTION_CHARS = 400    # Only the head of long descriptions is worth scanning
+
+# Tokens are runs of [0-9a-z] (uppercase folded, everything else separates words).
+# Each keyword word is packed into an int64 as base-37 digits, so keyword words
+# must be at most MAX_WORD_LEN characters long. A token of at least
+# MIN_PLURAL_LEN characters ending in "s" also matches its singular.
+MAX_WORD_LEN = 12
+MIN_PLURAL_LEN = 4
+_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+_BASE = len(_ALPHABET) + 1
+_DIGITS = np.zeros(256, dtype=np.uint8)
+for _i, _ch in enumerate(_ALPHABET, start=1):
+    _DIGITS[ord(_ch)] = _i
+    _DIGITS[ord(_ch.upper())] = _i
+_DIGIT_TABLE = _DIGITS.tobytes()  # Same mapping for bytes.translate, which is much faster
+
+# Each template field is its own segment, ended by SEGMENT_SEP. Two-word keywords
+# only match inside a phrase: segments, punctuation and long gaps all end a phrase.
+SEGMENT_SEP = "\x1e"
+TITLE_FIELD, DESCRIPTION_FIELD, SOURCE_TAGS_FIELD = range(3)  # Segment order in the buffer
+MAX_PHRASE_GAP = 4
+_PHRASE_BREAK = np.zeros(256, dtype=bool)
+_PHRASE_BREAK[list(map(ord, SEGMENT_SEP + "\n|,;:.!?()/"))] = True
+
+
+def encode_word(word: str) -> int:
+    """Pack a keyword word into the same int64 code tokenize() computes for tokens."""
+    if len(word) > MAX_WORD_LEN or any(ch not in _ALPHABET for ch in word):
+        raise ValueError(f"Keyword word '{word}' must be 1-{MAX_WORD_LEN} chars of [0-9a-z]")
+    code = 0
+    for i in range(MAX_WORD_LEN):
+        code = code * _BASE + (_ALPHABET.index(word[i]) + 1 if i < len(word) else 0)
+    return code
+
+
+def build_keyword_matrix() -> tuple[list[str], list[str], np.ndarray]:
+    """Flatten TAXONOMY into a keyword list and a (keywords × tags) membership matrix."""
+    tag_names = list(TAXONOMY)
+    keywords: list[str] = []
+    rows: list[int] = []
+    cols: list[int] = []
+    for col, tag in enumerate(tag_names):
+        for kw in TAXONOMY[tag]:
+            if len(kw.split()) > 2:
+                raise ValueError(f"Keyword '{kw}' has more than two words")
+            if kw not in keywords:
+                keywords.append(kw)
+            rows.append(keywords.index(kw))
+            cols.append(col)
+
+    membership = np.zeros((len(keywords), len(tag_names)), dtype=np.float32)
+    membership[rows, cols] = 1.0
+    return keywords, tag_names, membership
+
+
+def encode_segments(values: list[str]) -> tuple[bytes, np.ndarray]:
+    """Join field values into one UTF-8 buffer, one segment each.
+
+    Returns the buffer and the offsets of its segment separators.
+    """
+    encoded = SEGMENT_SEP.join(values).encode("utf-8")
+    seps = np.flatnonzero(np.frombuffer(encoded, dtype=np.uint8) == ord(SEGMENT_SEP))
+    if len(seps) != len(values) - 1:
+        # A value contained the separator itself; strip it and start over
+        return encode_segments([v.replace(SEGMENT_SEP, " ") for v in values])
+    return encoded, seps
+
+
+def tokenize(templates: list[dict], vocabulary: list[str]) -> tuple[np.ndarray, ...]:
+    """Tokenize the whole catalogue in one pass over a single byte buffer.
+
+    The buffer holds every title, then every description head, then every
+    template's source tags, one segment per template and field. The assigned
+    category and tags are left out so re-running is idempotent.
+
+    Returns four parallel arrays describing every token that is a vocabulary
+    word: its index in the sorted `vocabulary`, the index of the template it
+    belongs to, its field (TITLE_FIELD, DESCRIPTION_FIELD or SOURCE_TAGS_FIELD),
+    and whether it is directly followed by the next hit in the same phrase.
+    """
+    n_docs = len(templates)
+    titles = [t.get("title") or "" for t in templates]
+    descriptions = [(t.get("description") or "")[:DESCRIPTION_CHARS] for t in templates]
+    source_tags = [" | ".join(t.get("sourceTags") or ()) for t in templates]
+    encoded, seps = encode_segments(titles + descriptions + source_tags)
+    buf = np.frombuffer(encoded + b" " * (MAX_WORD_LEN + 1), dtype=np.uint8)
+    digits = np.frombuffer(encoded.translate(_DIGIT_TABLE) + bytes(MAX_WORD_LEN + 1),
+                           dtype=np.uint8)
+
+    # Word boundaries are where the buffer switches between token and separator bytes
+    is_word = np.concatenate([[False], digits > 0])
+    bounds = np.flatnonzero(is_word[1:] != is_word[:-1])
+    starts = bounds[0::2]
+    lengths = bounds[1::2] - starts
+
+    # Cheap prefilter on (length, first three characters) before packing full codes;
+    # characters past the end of a short word read as digit 0 (the byte after a
+    # one-letter word is always a separator, so only the third needs masking)
+    def prefix_key(length, d0, d1, d2):
+        return ((length * _BASE + d0) * _BASE + d1) * _BASE + d2
+
+    allowed = np.zeros((MAX_WORD_LEN + 3) * _BASE ** 3, dtype=bool)
+    for word in vocabulary:
+        head = [int(_DIGITS[ord(ch)]) for ch in (word + "  ")[:3]]
+        allowed[prefix_key(len(word), *head)] = True
+        if len(word) + 1 >= MIN_PLURAL_LEN:
+            allowed[prefix_key(len(word) + 1, *head)] = True
+    short = np.minimum(lengths, MAX_WORD_LEN + 2).astype(np.int32)  # Longer never match
+    candidates = np.flatnonzero(allowed[prefix_key(
+        short,
+        digits[starts].astype(np.int32),
+        digits[starts + 1],
+        digits[starts + 2] * (short > 2),
+    )])
+
+    cand_starts = starts[candidates]
+    cand_lengths = lengths[candidates]
+    codes = np.zeros(len(candidates), dtype=np.int64)
+    for i in range(MAX_WORD_LEN):
+        codes *= _BASE
+        codes += digits[cand_starts + i] * (cand_lengths > i)
+
+    vocab_codes = np.array([encode_word(w) for w in vocabulary], dtype=np.int64)
+
+    def lookup(keys):
+        ids = np.minimum(np.searchsorted(vocab_codes, keys), len(vocab_codes) - 1)
+        return ids, (vocab_codes[ids] == keys)
+
+    # Exact match first, then the token minus a trailing "s". A token one
+    # character over MAX_WORD_LEN was packed without its last character,
+    # which is exactly its singular.
+    word_ids, found = lookup(np.where(cand_lengths <= MAX_WORD_LEN, codes, -1))
+    plural = np.flatnonzero(~found & (cand_lengths >= MIN_PLURAL_LEN)
+                            & (digits[cand_starts + cand_lengths - 1] == _DIGITS[ord("s")]))
+    plural_lengths = cand_lengths[plural]
+    trailing_s = _DIGITS[ord("s")] * _BASE ** np.maximum(MAX_WORD_LEN - plural_lengths, 0)
+    stem_ids, stem_found = lookup(np.where(plural_lengths > MAX_WORD_LEN, codes[plural],
+                                           codes[plural] - trailing_s))
+    word_ids[plural] = stem_ids
+    found[plural] = stem_found
+    positions = candidates[found]
+    hit_starts = cand_starts[found]
+    hit_ends = hit_starts + cand_lengths[found]
+
+    segment_ids = np.searchsorted(seps, hit_starts)
+    doc_ids, fields = segment_ids % n_docs, segment_ids // n_docs
+
+    # A hit joins the next one if they are consecutive tokens and the short gap
+    # between them holds no phrase break (segment separators included)
+    joins_next = np.zeros(len(positions), dtype=bool)
+    pair = np.flatnonzero(positions[1:] == positions[:-1] + 1)
+    gap_starts = hit_ends[pair]
+    gap_lengths = hit_starts[pair + 1] - gap_starts
+    joined = gap_lengths <= MAX_PHRASE_GAP
+    for i in range(MAX_PHRASE_GAP):
+        joined &= ~(_PHRASE_BREAK[buf[gap_starts + i]] & (gap_lengths > i))
+    joins_next[pair] = joined
+    return word_ids[found], doc_ids, fields, joins_next
+
+
+def keyword_hits(word_ids: np.ndarray, doc_ids: np.ndarray, fields: np.ndarray,
+                 joins_next: np.ndarray, keywords: list[str],
+                 vocabulary: list[str]) -> tuple[np.ndarray, ...]:
+    """Locate every keyword occurrence. Returns parallel (doc, keyword, field) arrays."""
+    n_words = len(vocabulary)
+
+    # Keyword ids: one word → word id, two words → (n_words + id1) * n_words + id2
+    def keyword_id(kw: str) -> int:
+        ids = [vocabulary.index(w) for w in kw.split()]
+        return ids[0] if len(ids) == 1 else (n_words + ids[0]) * n_words + ids[1]
+
+    kw_ids = np.array([keyword_id(kw) for kw in keywords])
+    order = np.argsort(kw_ids)
+    sorted_ids = kw_ids[order]
+
+    # Candidates: every vocabulary word, plus every adjacent vocabulary pair in one phrase
+    pair = np.flatnonzero(joins_next)
+    candidates = np.concatenate([
+        word_ids,
+        (n_words + word_ids[pair]) * n_words + word_ids[pair + 1],
+    ])
+    docs = np.concatenate([doc_ids, doc_ids[pair]])
+    hit_fields = np.concatenate([fields, fields[pair]])
+
+    idx = np.minimum(np.searchsorted(sorted_ids, candidates), len(sorted_ids) - 1)
+    found = sorted_ids[idx] == candidates
+    return docs[found], order[idx[found]], hit_fields[found]
+
+
+def tag_scores(docs: np.ndarray, kws: np.ndarray, fields: np.ndarray, n_docs: int,
+               membership: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Score every (template, tag) pair from keyword hits.
+
+    Returns a (templates × tags) matrix of cosine similarities between each
+    template's TF-IDF keyword vector and each tag's unit-length keyword set,
+    and a matching matrix of field priorities: 2 if one of the tag's keywords
+    is in the title, 1 if only in the source tags, else 0. Normalizing by the
+    tag's keyword count keeps tags with long keyword lists from winning on
+    "suits any business" style descriptions.
+    """
+    n_kw, n_tags = membership.shape
+
+    # Collapse hits into unique (doc, keyword) pairs with per-field counts
+    pairs, inverse = np.unique(docs * n_kw + kws, return_inverse=True)
+    title_counts = np.bincount(inverse, weights=fields == TITLE_FIELD, minlength=len(pairs))
+    source_counts = np.bincount(inverse, weights=fields == SOURCE_TAGS_FIELD, minlength=len(pairs))
+    other_counts = np.bincount(inverse, minlength=len(pairs)) - title_counts
+    priority = np.where(title_counts > 0, 2, np.where(source_counts > 0, 1, 0))
+    pair_docs, pair_kws = np.divmod(pairs, n_kw)
+
+    # Smoothed IDF, sublinear TF (title weighted after the log), L2-normalized rows
+    df = np.bincount(pair_kws, minlength=n_kw)
+    idf = np.log((1 + n_docs) / (1 + df)) + 1.0
+    tf = TITLE_WEIGHT * np.log1p(title_counts) + np.log1p(other_counts)
+    weights = tf * idf[pair_kws]
+    norms = np.sqrt(np.bincount(pair_docs, weights=weights ** 2, minlength=n_docs))
+    weights /= norms[pair_docs]
+
+    # Sparse (docs × keywords) @ column-normalized membership: one entry per
+    # (doc, keyword) pair and tag of its keyword
+    kw_rows, kw_tags = np.nonzero(membership)  # (keyword, tag) links, keyword-sorted
+    tag_norms = np.sqrt(membership.sum(axis=0))
+    fanout = np.bincount(kw_rows, minlength=n_kw)[pair_kws]
+    hit = np.repeat(np.arange(len(pair_kws)), fanout)
+    nth = np.arange(len(hit)) - np.repeat(np.cumsum(fanout) - fanout, fanout)
+    links = np.searchsorted(kw_rows, pair_kws)[hit] + nth
+    cells = pair_docs[hit] * n_tags + kw_tags[links]
+
+    scores = np.bincount(cells, weights=weights[hit] / tag_norms[kw_tags[links]],
+                         minlength=n_docs * n_tags)
+    priorities = np.zeros(n_docs * n_tags, dtype=np.int8)
+    for level in (1, 2):  # Higher levels are written last, so they win
+        priorities[cells[priority[hit] == level]] = level
+    return scores.reshape(n_docs, n_tags), priorities.reshape(n_docs, n_tags)
+
+
+def assign_tags(templates: list[dict]) -> int:
+    """Rewrite `tags` and `category` in place. Returns the number of templates tagged.
+
+    The scraper-provided tags are kept in `sourceTags` on first run and used as
+    input from then on.
+    """
+    if not templates:
+        return 0
+
+    for tpl in templates:
+        if "sourceTags" not in tpl:
+            tpl["sourceTags"] = [t for t in tpl.get("tags", []) if t != tpl.get("platform")]
+
+    keywords, tag_names, membership = build_keyword_matrix()
+    vocabulary = sorted({w for kw in keywords for w in kw.split()},
+                        key=encode_word)
+    word_ids, doc_ids, fields, joins_next = tokenize(templates, vocabulary)
+    docs, kws, hit_fields = keyword_hits(word_ids, doc_ids, fields, joins_next,
+                                         keywords, vocabulary)
+    scores, priorities = tag_scores(docs, kws, hit_fields, len(templates), membership)
+
+    # Top MAX_TAGS per row, best first. Scores are at most 1, so adding the field
+    # priority ranks title tags, then source-tag tags, ahead of description-only
+    # ones: the category follows the title whenever it names a tag. Stable sort
+    # keeps TAXONOMY order on ties.
+    ranking = scores + priorities
+    top = np.argsort(-ranking, axis=1, kind="stable")[:, :MAX_TAGS]
+    keep = np.take_along_axis(ranking, top, axis=1) >= MIN_SCORE
+
+    # Few distinct (platform, tags) combinations exist: build each list once from
+    # its first template, then the per-template work is two dict writes
+    platforms = [tpl.get("platform") or "" for tpl in templates]
+    _, platform_ids = np.unique(platforms, return_inverse=True)
+    slots = np.where(keep, top + 1, 0)  # Tag index + 1, or 0 for no tag
+    radix = (len(tag_names) + 1) ** np.arange(MAX_TAGS + 1)
+    combo_keys = np.column_stack([slots, platform_ids]) @ radix
+    _, firsts, combo_ids = np.unique(combo_keys, return_index=True, return_inverse=True)
+
+    combo_tags = []
+    for row in firsts.tolist():
+        platform = platforms[row]
+        tags = [tag_names[slot - 1] for slot in slots[row].tolist() if slot]
+        combo_tags.append((([platform] if platform else []) + tags,
+                           tags[0] if tags else FALLBACK_CATEGORY))
+
+    for tpl, combo in zip(templates, combo_ids.tolist()):
+        tags, category = combo_tags[combo]
+        tpl["tags"] = tags[:]
+        tpl["category"] = category
+
+    return int(np.count_nonzero(keep[:, 0]))
+
+
+def load_existing() -> dict:
+    """Load existing templates.json."""
+    if OUTPUT_FILE.exists():
+        try:
+            return json.loads(OUTPUT_FILE.read_text())
+        except (json.JSONDecodeError, KeyError):
+            pass
+    return {"lastUpdated": "", "source": "aggregated", "templates": []}
+
+
+def save_templates(data: dict):
+    """Save templates.json."""
+    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    data["lastUpdated"] = datetime.now(timezone.utc).isoformat()
+    OUTPUT_FILE.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+
+
+def main():
+    print("🏷  Tagger — assigning taxonomy tags to templates...")
+
+    data = load_existing()
+    templates = data.get("templates", [])
+    if not templates:
+        print("⚠ No templates found. Nothing to tag.", file=sys.stderr)
+        return
+
+    start = time.perf_counter()
+    tagged = assign_tags(templates)
+    elapsed = time.perf_counter() - start
+
+    save_templates(data)
+
+    print(f"✅ Tagged {tagged}/{len(templates)} templates in {elapsed * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Tests for the template auto-tagger.
+Run from the repo root with: python -m pytest scripts
+"""
+
+from tag_templates import assign_tags
+
+
+def template(title: str, description: str = "", source_tags=(), platform: str = "ThemeForest") -> dict:
+    """A minimal scraped template."""
+    return {"title": title, "description": description, "platform": platform,
+            "tags": [platform, *source_tags]}
+
+
+def tag(*templates: dict) -> list[dict]:
+    """Run the tagger over `templates` and return them."""
+    assign_tags(list(templates))
+    return list(templates)
+
+
+# ── Category follows the title ──────────────────────────────────────────────
+
+MULTIPURPOSE = ("Perfect for business, portfolio, agency, photography, travel, restaurant, "
+                "hotel, medical, dentist, clinic, fitness, gym, yoga, spa, salon, beauty, "
+                "wedding, construction, plumber, lawyer, education and kindergarten websites.")
+
+
+def test_category_follows_title_over_multipurpose_description():
+    kalium, brooklyn = tag(
+        template("Kalium 3 | Creative WordPress & WooCommerce Theme", MULTIPURPOSE),
+        template("Brooklyn | Creative Multipurpose Responsive WordPress Theme", MULTIPURPOSE),
+    )
+    assert kalium["category"] in ("Creative", "Ecommerce")
+    assert brooklyn["category"] == "Creative"
+
+
+def test_long_keyword_lists_do_not_win_on_listing_descriptions():
+    (canvas,) = tag(template("Canvas | The Multi-Purpose HTML5 Template", MULTIPURPOSE,
+                             source_tags=["business", "corporate", "gallery"]))
+    assert canvas["category"] == "Business"
+
+
+# ── Keyword matching ────────────────────────────────────────────────────────
+
+def taxonomy_tags(tpl: dict) -> list[str]:
+    """Assigned tags without the platform tag."""
+    return [t for t in tpl["tags"] if t != tpl["platform"]]
+
+
+def test_single_word_keyword():
+    (tpl,) = tag(template("Yoga Theme"))
+    assert tpl["category"] == "Health"
+
+
+def test_two_word_keyword():
+    (tpl,) = tag(template("Homely Theme", "Listings for real estate agents."))
+    assert "Real Estate" in taxonomy_tags(tpl)
+
+
+def test_two_word_keyword_does_not_span_fields():
+    (tpl,) = tag(template("Studio Real", "Estate sale tracker."))
+    assert "Real Estate" not in taxonomy_tags(tpl)
+
+
+def test_two_word_keyword_does_not_span_punctuation():
+    (tpl,) = tag(template("Keep It Real. Estate Planning Kit"))
+    assert "Real Estate" not in taxonomy_tags(tpl)
+
+
+def test_plural_of_eleven_and_twelve_letter_keywords():
+    electricians, photographers = tag(template("Electricians Theme"),
+                                      template("Photographers Theme"))
+    assert electricians["category"] == "Construction"
+    assert photographers["category"] == "Photography"
+
+
+def test_tokens_longer_than_a_plural_never_match():
+    (tpl,) = tag(template("Photographerss Photographerxyz Theme"))
+    assert tpl["category"] == "General"
+
+
+def test_uppercase_and_non_ascii():
+    upper, accented = tag(template("PORTFOLIO THEME"),
+                          template("Café Ünïcödé ☕ Portfolio — Résumé"))
+    assert upper["category"] == "Portfolio"
+    assert accented["category"] == "Portfolio"
+
+
+def test_values_containing_the_segment_separator():
+    broken, after = tag(template("Blog\x1eTheme", "Weekly\x1enews"), template("Restaurant Theme"))
+    assert broken["category"] == "Blog"
+    assert after["category"] == "Restaurant"
+
+
+def test_no_hits():
+    (tpl,) = tag(template("Xtract", "A template."))
+    assert tpl["category"] == "General"
+    assert tpl["tags"] == ["ThemeForest"]
+    assert assign_tags([]) == 0
+
+
+def test_source_tags_are_kept_and_rerun_is_stable():
+    templates = [template("Yoga Theme", MULTIPURPOSE, source_tags=["wordpress", "gym"]),
+                 template("Kalium 3 | Creative WordPress & WooCommerce Theme", MULTIPURPOSE),
+                 template("Xtract")]
+    tag(*templates)
+    first = [dict(t) for t in templates]
+    tag(*templates)
+    assert templates == first
+    assert templates[0]["sourceTags"] == ["wordpress", "gym"]
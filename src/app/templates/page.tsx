@@ -119,7 +119,8 @@ export default function TemplatesPage() {
         (t) =>
           t.title.toLowerCase().includes(q) ||
           t.author.toLowerCase().includes(q) ||
-          t.tags.some((tag) => tag.toLowerCase().includes(q))
+          t.tags.some((tag) => tag.toLowerCase().includes(q)) ||
+          (t.sourceTags ?? []).some((tag) => tag.toLowerCase().includes(q))
       );
     }
 
@@ -60,6 +60,18 @@ export default function TemplatePreviewModal({
     return images;
   }, [template]);
 
+  // Taxonomy tags first, then the marketplace's own tags
+  const allTags = useMemo(() => {
+    if (!template) return [];
+    const tags = [...template.tags];
+    for (const tag of template.sourceTags ?? []) {
+      if (tag && !tags.includes(tag)) {
+        tags.push(tag);
+      }
+    }
+    return tags;
+  }, [template]);
+
   // Reset active image when template changes
   const handleEnter = () => setActiveImage(0);
 
@@ -462,7 +474,7 @@ export default function TemplatePreviewModal({
         <Divider sx={{ mb: 2, borderColor: alpha("#F1F5F9", 0.08) }} />
 
         {/* Tags */}
-        {template.tags.length > 0 && (
+        {allTags.length > 0 && (
           <Stack
             direction="row"
             spacing={0.75}
@@ -470,7 +482,7 @@ export default function TemplatePreviewModal({
             useFlexGap
             sx={{ mb: 3 }}
           >
-            {template.tags.map((tag) => (
+            {allTags.map((tag) => (
               <Chip
                 key={tag}
                 label={tag}
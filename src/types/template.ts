@@ -9,6 +9,7 @@ export interface Template {
   ratingCount?: number;
   sales: number;
   tags: string[];
+  sourceTags?: string[];
   thumbnail: string;
   screenshots?: string[];
   url: string;